@@ -1,3 +1,4 @@
+import re
 from typing import Dict, Any
 from math import pi, sin, cos
 import numpy as np
@@ -144,13 +145,15 @@ class SpacePlot:
         return dict(ha='center', va='bottom')
 
 
+_label_regex = re.compile(r'^(\D+?)(\d*)$')
+
+
 def normalize_name(name):
     if name == 'G':
         return '\\Gamma'
 
     if len(name) > 1:
-        import re
-        m = re.match(r'^(\D+?)(\d*)$', name)
+        m = _label_regex.match(name)
         if m is None:
             raise ValueError('Bad label: {}'.format(name))
         name, num = m.group(1, 2)
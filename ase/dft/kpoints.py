@@ -121,6 +121,9 @@ def kpoint_convert(cell_cv, skpts_kc=None, ckpts_kv=None):
         raise KeyError('Either scaled or cartesian coordinates must be given.')
 
 
+_path_label_regex = re.compile(r'([A-Z][a-z0-9]*)')
+
+
 def parse_path_string(s):
     """Parse compact string representation of BZ path.
 
@@ -138,7 +141,7 @@ def parse_path_string(s):
     paths = []
     for path in s.split(','):
         names = [name
-                 for name in re.split(r'([A-Z][a-z0-9]*)', path)
+                 for name in _path_label_regex.split(path)
                  if name]
         paths.append(names)
     return paths
@@ -151,6 +154,20 @@ def resolve_kpt_path_string(path, special_points):
     return paths, coords
 
 
+def _resolve_kpt_paths(paths, special_points):
+    """Get coordinates of all subpaths (lists of labels) as one array.
+
+    Returns an (M, 3) array of all coordinates along with offsets such
+    that subpath i is coords[offsets[i]:offsets[i + 1]]."""
+    # Look up only the labels on the path and build one array, rather
+    # than one small array per subpath:
+    coords = np.array([special_points[sym]
+                       for subpath in paths for sym in subpath],
+                      dtype=float).reshape(-1, 3)
+    offsets = np.cumsum([0] + [len(subpath) for subpath in paths])
+    return coords, offsets
+
+
 def resolve_custom_points(pathspec, special_points, eps):
     """Resolve a path specification into a string.
 
@@ -458,21 +475,25 @@ class BandPath:
         plotkwargs.pop('dimension', None)
 
         special_points = self.special_points
-        labelseq, coords = resolve_kpt_path_string(self.path,
-                                                   special_points)
+        labelseq = parse_path_string(self.path)
 
-        paths = []
         points_already_plotted = set()
-        for subpath_labels, subpath_coords in zip(labelseq, coords):
-            subpath_coords = np.array(subpath_coords)
+        for subpath_labels in labelseq:
             points_already_plotted.update(subpath_labels)
-            paths.append((subpath_labels, self._scale(subpath_coords)))
 
         # Add each special point as a single-point subpath if they were
         # not plotted already:
-        for label, point in special_points.items():
+        for label in special_points:
             if label not in points_already_plotted:
-                paths.append(([label], [self._scale(point)]))
+                labelseq.append([label])
+
+        # All subpaths are stored in one array, scaled by one product
+        # and sliced afterwards:
+        coords, offsets = _resolve_kpt_paths(labelseq, special_points)
+        scaled_coords = self._scale(coords)
+        paths = [(subpath_labels, scaled_coords[start:end])
+                 for subpath_labels, start, end
+                 in zip(labelseq, offsets[:-1], offsets[1:])]
 
         kw = {'vectors': True,
               'pointstyle': {'marker': '.'}}
@@ -4,6 +4,7 @@ Module for povray file format support.
 See http://www.povray.org/ for details on the format.
 """
 from collections.abc import Sequence
+from functools import lru_cache
 from subprocess import check_call, DEVNULL
 from os import unlink
 from pathlib import Path
@@ -12,7 +13,6 @@ import numpy as np
 
 from ase.io.utils import PlottingVariables
 from ase.constraints import FixAtoms
-from ase import Atoms
 
 
 def pa(array):
@@ -20,16 +20,32 @@ def pa(array):
     return '<' + ', '.join(f"{x:>6.2f}" for x in tuple(array)) + '>'
 
 
+def pa_many(array):
+    """Povray array syntax for each row of an (N, 3) array"""
+    fmt = '<{:>6.2f}, {:>6.2f}, {:>6.2f}>'.format
+    return [fmt(*row)
+            for row in np.asarray(array, dtype=float).reshape(-1, 3).tolist()]
+
+
 def pc(array):
     """Povray color syntax"""
-    if isinstance(array, str):
-        return 'color ' + array
-    if isinstance(array, float):
-        return f'rgb <{array:.2f}>*3'.format(array)
-    L = len(array)
+    if not isinstance(array, (str, float)):
+        array = tuple(array)
+    return _pc(array)
+
+
+@lru_cache()
+def _pc(color):
+    # Colors are drawn from a small palette and repeated for every atom
+    # and bond, so the formatted strings are cached.
+    if isinstance(color, str):
+        return 'color ' + color
+    if isinstance(color, float):
+        return f'rgb <{color:.2f}>*3'
+    L = len(color)
     if L > 2 and L < 6:
         return f"rgb{'' if L == 3 else 't' if L == 4 else 'ft'} <" +\
-            ', '.join(f"{x:.2f}" for x in tuple(array)) + '>'
+            ', '.join(f"{x:.2f}" for x in color) + '>'
 
 
 def get_bondpairs(atoms, radius=1.1):
@@ -51,16 +67,112 @@ def get_bondpairs(atoms, radius=1.1):
     integers."""
 
     from ase.data import covalent_radii
-    from ase.neighborlist import NeighborList
+    from ase.neighborlist import NeighborList, NewPrimitiveNeighborList
     cutoffs = radius * covalent_radii[atoms.numbers]
-    nl = NeighborList(cutoffs=cutoffs, self_interaction=False)
+    skin = 0.3
+
+    if not atoms.pbc.any() and len(atoms) < 500:
+        # Checking all pairs directly is much cheaper than binning
+        # for small molecules and clusters
+        return _get_bondpairs_nonperiodic(atoms.positions, cutoffs + skin)
+
+    if len(atoms) < 32:
+        # The setup cost of binning dominates for small periodic cells
+        nl = NeighborList(cutoffs=cutoffs, skin=skin, self_interaction=False)
+        nl.update(atoms)
+        bondpairs = []
+        for a in range(len(atoms)):
+            indices, offsets = nl.get_neighbors(a)
+            bondpairs.extend([(a, a2, offset)
+                              for a2, offset in zip(indices, offsets)])
+        return bondpairs
+
+    nl = NeighborList(cutoffs=cutoffs, skin=skin, self_interaction=False,
+                      primitive=NewPrimitiveNeighborList)
     nl.update(atoms)
-    bondpairs = []
-    for a in range(len(atoms)):
-        indices, offsets = nl.get_neighbors(a)
-        bondpairs.extend([(a, a2, offset)
-                          for a2, offset in zip(indices, offsets)])
-    return bondpairs
+    # The pairs are stored sorted by first atom, i.e. in the order that
+    # get_neighbors() would return them atom by atom:
+    return list(zip(nl.nl.pair_first.tolist(), nl.nl.pair_second.tolist(),
+                    nl.nl.offset_vec))
+
+
+def _get_bondpairs_nonperiodic(positions, cutoffs):
+    """Bond pairs (a, b, offset) with a < b and distance less than the sum
+    of their cutoffs, checking all pairs of atoms."""
+    a, b = np.triu_indices(len(positions), 1)
+    d2 = ((positions[b] - positions[a])**2).sum(1)
+    mask = d2 < (cutoffs[a] + cutoffs[b])**2
+    a = a[mask]
+    b = b[mask]
+    return list(zip(a.tolist(), b.tolist(), np.zeros((len(a), 3), int)))
+
+
+def _parse_bondatoms(bondatoms):
+    """Validate bondatoms (see POVRAY) and convert them to arrays.
+
+    Returns atom indices a and b, offsets, bond orders, bond offsets and
+    a mask of the bonds which use the default bond offset
+    (bondlinewidth, bondlinewidth, 0)."""
+    bond_a = []
+    bond_b = []
+    offsets = []
+    orders = []
+    bond_offsets = []
+    default_offset = []
+    for pair in bondatoms:
+        # Make sure that each pair has 4 componets: a, b, offset,
+        #                                           bond_order, bond_offset
+        # a, b: atom index to draw bond
+        # offset: original meaning to make offset for mid-point.
+        # bond_oder: if not supplied, set it to 1 (single bond).
+        #            It can be  1, 2, 3, corresponding to single,
+        #            double, triple bond
+        # bond_offset: displacement from original bond position.
+        #              Default is (bondlinewidth, bondlinewidth, 0)
+        #              for bond_order > 1.
+        default = False
+        if len(pair) == 2:
+            a, b = pair
+            offset = (0, 0, 0)
+            bond_order = 1
+            bond_offset = (0, 0, 0)
+        elif len(pair) == 3:
+            a, b, offset = pair
+            bond_order = 1
+            bond_offset = (0, 0, 0)
+        elif len(pair) == 4:
+            a, b, offset, bond_order = pair
+            bond_offset = (0, 0, 0)
+            default = True
+        elif len(pair) > 4:
+            a, b, offset, bond_order, bond_offset = pair
+        else:
+            raise RuntimeError('Each list in bondatom must have at least '
+                               '2 entries. Error at %s' % (pair,))
+
+        if len(offset) != 3:
+            raise ValueError('offset must have 3 elements. '
+                             'Error at %s' % (pair,))
+        if len(bond_offset) != 3:
+            raise ValueError('bond_offset must have 3 elements. '
+                             'Error at %s' % (pair,))
+        if bond_order not in [0, 1, 2, 3]:
+            raise ValueError('bond_order must be either 0, 1, 2, or 3. '
+                             'Error at %s' % (pair,))
+
+        bond_a.append(a)
+        bond_b.append(b)
+        offsets.append(offset)
+        orders.append(bond_order)
+        bond_offsets.append(bond_offset)
+        default_offset.append(default)
+
+    return (np.array(bond_a, dtype=int),
+            np.array(bond_b, dtype=int),
+            np.array(offsets, dtype=float).reshape(-1, 3),
+            np.array(orders, dtype=int),
+            np.array(bond_offsets, dtype=float).reshape(-1, 3),
+            np.array(default_offset, dtype=bool))
 
 
 def set_high_bondorder_pairs(bondpairs, high_bondorder_pairs=None):
@@ -148,6 +260,19 @@ class POVRAY:
                 'reflection 0.25 roughness 0.001}'),
     )
 
+    # The 12 edges of the unit cell as pairs of indices into the 8 cell
+    # vertices, ordered along the first, second and third cell vector
+    _cell_edges = np.array([[0, 4], [2, 6], [3, 7], [1, 5],
+                            [0, 2], [4, 6], [5, 7], [1, 3],
+                            [0, 1], [4, 5], [6, 7], [2, 3]])
+
+    # Shift of the bond_offset for each half-cylinder pair drawn for a bond,
+    # indexed by bond order
+    _bond_shifts = np.array([[0., 0., 0.],
+                             [0., 0., 0.],
+                             [-.5, .5, 0.],
+                             [0., 1., -1.]])
+
     def __init__(self, cell, cell_vertices, positions, diameters, colors,
                  image_width, image_height, constraints=tuple(), isosurfaces=[],
                  display=False, pause=True, transparent=True, canvas_width=None,
@@ -290,9 +415,7 @@ class POVRAY:
         self.constrainatoms = []
         for c in constraints:
             if isinstance(c, FixAtoms):
-                # self.constrainatoms.extend(c.index) # is this list-like?
-                for n, i in enumerate(c.index):
-                    self.constrainatoms += [i]
+                self.constrainatoms.extend(c.index)
 
     @classmethod
     def from_PlottingVariables(cls, pvars, **kwargs):
@@ -343,6 +466,9 @@ Verbose=False
     def write_pov(self, path):
         """Write pov file."""
 
+        bond_a, bond_b, offsets, orders, bond_offsets, default_offset = \
+            _parse_bondatoms(self.bondatoms)
+
         point_lights = '\n'.join(f"light_source {{{pa(loc)} {pc(rgb)}}}"
                                  for loc, rgb in self.point_lights)
 
@@ -371,168 +497,108 @@ Verbose=False
         # Draw unit cell
         cell_vertices = ''
         if self.cell_vertices is not None:
-            for c in range(3):
-                for j in ([0, 0], [1, 0], [1, 1], [0, 1]):
-                    p1 = self.cell_vertices[tuple(j[:c]) + (0,) + tuple(j[c:])]
-                    p2 = self.cell_vertices[tuple(j[:c]) + (1,) + tuple(j[c:])]
-
-                    distance = np.linalg.norm(p2 - p1)
-                    if distance < 1e-12:
-                        continue
-
-                    cell_vertices += f'cylinder {{{pa(p1)}, {pa(p2)}, '\
-                                     f'Rcell pigment {{Black}}}}\n'
-                    # all strings are f-strings for consistency
-            cell_vertices = cell_vertices.strip('\n')
+            vertices = self.cell_vertices.reshape(8, 3)
+            starts = vertices[self._cell_edges[:, 0]]
+            ends = vertices[self._cell_edges[:, 1]]
+            edges = ends - starts
+            keep = np.einsum('ij,ij->i', edges, edges) >= 1e-24
+            cell_vertices = '\n'.join(
+                f'cylinder {{{p1}, {p2}, Rcell pigment {{Black}}}}'
+                for p1, p2 in zip(pa_many(starts[keep]), pa_many(ends[keep])))
 
         # Draw atoms
-        a = 0
-        atoms = ''
-        for loc, dia, col in zip(self.positions, self.diameters, self.colors):
-            tex = 'ase3'
-            trans = 0.
-            if self.textures is not None:
-                tex = self.textures[a]
-            if self.transmittances is not None:
-                trans = self.transmittances[a]
-            atoms += f'atom({pa(loc)}, {dia/2.:.2f}, {pc(col)}, '\
-                     f'{trans}, {tex}) // #{a:n}\n'
-            a += 1
-        atoms = atoms.strip('\n')
-
-        # Draw atom bonds
+        textures = self.textures
+        if textures is None:
+            textures = ['ase3'] * len(self.positions)
+        transmittances = self.transmittances
+        if transmittances is None:
+            transmittances = [0.] * len(self.positions)
+
+        # pc() is cached, so repeated colors are formatted only once
+        color_strings = [pc(color) for color in self.colors]
+        radii = [f'{d / 2.:.2f}'
+                 for d in np.asarray(self.diameters, dtype=float).tolist()]
+        atoms = '\n'.join(
+            f'atom({loc}, {r}, {col}, {trans}, {tex}) // #{a:n}'
+            for a, (loc, r, col, trans, tex) in enumerate(zip(
+                pa_many(self.positions), radii, color_strings,
+                transmittances, textures)))
+
+        # Draw atom bonds.  The bondatoms were converted to arrays above,
+        # and the cylinders are computed for all bonds at once.
         bondatoms = ''
-        for pair in self.bondatoms:
-            # Make sure that each pair has 4 componets: a, b, offset,
-            #                                           bond_order, bond_offset
-            # a, b: atom index to draw bond
-            # offset: original meaning to make offset for mid-point.
-            # bond_oder: if not supplied, set it to 1 (single bond).
-            #            It can be  1, 2, 3, corresponding to single,
-            #            double, triple bond
-            # bond_offset: displacement from original bond position.
-            #              Default is (bondlinewidth, bondlinewidth, 0)
-            #              for bond_order > 1.
-            if len(pair) == 2:
-                a, b = pair
-                offset = (0, 0, 0)
-                bond_order = 1
-                bond_offset = (0, 0, 0)
-            elif len(pair) == 3:
-                a, b, offset = pair
-                bond_order = 1
-                bond_offset = (0, 0, 0)
-            elif len(pair) == 4:
-                a, b, offset, bond_order = pair
-                bond_offset = (self.bondlinewidth, self.bondlinewidth, 0)
-            elif len(pair) > 4:
-                a, b, offset, bond_order, bond_offset = pair
-            else:
-                raise RuntimeError('Each list in bondatom must have at least '
-                                   '2 entries. Error at %s' % pair)
-
-            if len(offset) != 3:
-                raise ValueError('offset must have 3 elements. '
-                                 'Error at %s' % pair)
-            if len(bond_offset) != 3:
-                raise ValueError('bond_offset must have 3 elements. '
-                                 'Error at %s' % pair)
-            if bond_order not in [0, 1, 2, 3]:
-                raise ValueError('bond_order must be either 0, 1, 2, or 3. '
-                                 'Error at %s' % pair)
-
-            # Up to here, we should have all a, b, offset, bond_order,
-            # bond_offset for all bonds.
-
-            # Rotate bond_offset so that its direction is 90 deg. off the bond
-            # Utilize Atoms object to rotate
-            if bond_order > 1 and np.linalg.norm(bond_offset) > 1.e-9:
-                tmp_atoms = Atoms('H3')
-                tmp_atoms.set_cell(self.cell)
-                tmp_atoms.set_positions([
-                    self.positions[a],
-                    self.positions[b],
-                    self.positions[b] + np.array(bond_offset),
-                ])
-                tmp_atoms.center()
-                tmp_atoms.set_angle(0, 1, 2, 90)
-                bond_offset = tmp_atoms[2].position - tmp_atoms[1].position
-
-            R = np.dot(offset, self.cell)
-            mida = 0.5 * (self.positions[a] + self.positions[b] + R)
-            midb = 0.5 * (self.positions[a] + self.positions[b] - R)
-            if self.textures is not None:
-                texa = self.textures[a]
-                texb = self.textures[b]
-            else:
-                texa = texb = 'ase3'
-
-            if self.transmittances is not None:
-                transa = self.transmittances[a]
-                transb = self.transmittances[b]
-            else:
-                transa = transb = 0.
+        if len(bond_a):
+            bond_offsets[default_offset] = (self.bondlinewidth,
+                                            self.bondlinewidth, 0)
+            posa = self.positions[bond_a]
+            posb = self.positions[bond_b]
+
+            # Rotate bond_offset so that its direction is 90 deg. off the
+            # bond, keeping its length and the plane it spans with the bond
+            norms = np.linalg.norm(bond_offsets, axis=1)
+            rotate = np.flatnonzero((orders > 1) & (norms > 1.e-9))
+            d = posb[rotate] - posa[rotate]
+            # A bond to the atom's own periodic image has no direction here
+            dnorms = np.linalg.norm(d, axis=1)
+            nonzero = dnorms > 1.e-9
+            rotate = rotate[nonzero]
+            d = d[nonzero] / dnorms[nonzero, np.newaxis]
+            perp = bond_offsets[rotate]
+            perp -= np.einsum('ij,ij->i', d, perp)[:, np.newaxis] * d
+            perp_norms = np.linalg.norm(perp, axis=1)
+            ok = perp_norms > 1.e-9
+            rotate = rotate[ok]
+            bond_offsets[rotate] = (perp[ok] * (norms[rotate] /
+                                                perp_norms[ok])[:, np.newaxis])
+
+            R = np.dot(offsets, self.cell)
+            mida = 0.5 * (posa + posb + R)
+            midb = 0.5 * (posa + posb - R)
 
             # draw bond, according to its bond_order.
             # bond_order == 0: No bond is plotted
             # bond_order == 1: use original code
-            # bond_order == 2: draw two bonds, one is shifted by bond_offset/2,
-            #                  and another is shifted by -bond_offset/2.
+            # bond_order == 2: draw two bonds, one is shifted by
+            #                  bond_offset/2, and another is shifted by
+            #                  -bond_offset/2.
             # bond_order == 3: draw two bonds, one is shifted by bond_offset,
             #                  and one is shifted by -bond_offset, and the
             #                  other has no shift.
-            # To shift the bond, add the shift to the first two coordinate in
-            # write statement.
-
-            posa = self.positions[a]
-            posb = self.positions[b]
-            cola = self.colors[a]
-            colb = self.colors[b]
-
-            if bond_order == 1:
-                draw_tuples = (
-                    (posa, mida, cola, transa, texa),
-                    (posb, midb, colb, transb, texb))
-
-            elif bond_order == 2:
-                bs = [x / 2 for x in bond_offset]
-                draw_tuples = (
-                    (posa - bs, mida - bs, cola, transa, texa),
-                    (posb - bs, midb - bs, colb, transb, texb),
-                    (posa + bs, mida + bs, cola, transa, texa),
-                    (posb + bs, midb + bs, colb, transb, texb))
-
-            elif bond_order == 3:
-                bs = bond_offset
-                draw_tuples = (
-                    (posa, mida, cola, transa, texa),
-                    (posb, midb, colb, transb, texb),
-                    (posa + bs, mida + bs, cola, transa, texa),
-                    (posb + bs, midb + bs, colb, transb, texb),
-                    (posa - bs, mida - bs, cola, transa, texa),
-                    (posb - bs, midb - bs, colb, transb, texb))
-
-            bondatoms += ''.join(f'cylinder {{{pa(p)}, '
-                                 f'{pa(m)}, Rbond texture{{pigment '
-                                 f'{{color {pc(c)} '
-                                 f'transmit {tr}}} finish{{{tx}}}}}}}\n'
-                                 for p, m, c, tr, tx in
-                                 draw_tuples)
-
-        bondatoms = bondatoms.strip('\n')
+            # Each bond is drawn as 2 * bond_order half-cylinders, which
+            # alternate between the a and b sides of the bond.
+            nsegments = 2 * orders
+            bond = np.repeat(np.arange(len(orders)), nsegments)
+            k = (np.arange(len(bond)) -
+                 np.repeat(np.cumsum(nsegments) - nsegments, nsegments))
+            side_a = (k % 2 == 0)[:, np.newaxis]
+            shift = self._bond_shifts[orders[bond], k // 2]
+
+            starts = np.where(side_a, posa[bond], posb[bond])
+            ends = np.where(side_a, mida[bond], midb[bond])
+            shifted = np.flatnonzero(shift)
+            bs = shift[shifted, np.newaxis] * bond_offsets[bond[shifted]]
+            starts[shifted] += bs
+            ends[shifted] += bs
+
+            atom_indices = np.where(side_a[:, 0], bond_a[bond], bond_b[bond])
+            segments = []
+            for p, m, i in zip(pa_many(starts), pa_many(ends),
+                               atom_indices.tolist()):
+                segments.append(
+                    f'cylinder {{{p}, {m}, Rbond texture{{pigment '
+                    f'{{color {color_strings[i]} '
+                    f'transmit {transmittances[i]}}} '
+                    f'finish{{{textures[i]}}}}}}}')
+            bondatoms = '\n'.join(segments)
 
         # Draw constraints if requested
         constraints = ''
         if self.exportconstraints:
-            for a in self.constrainatoms:
-                dia = self.diameters[a]
-                loc = self.positions[a]
-                trans = 0.0
-                if self.transmittances is not None:
-                    trans = self.transmittances[a]
-                constraints += f'constrain({pa(loc)}, {dia/2.:.2f}, Black, '\
-                    f'{trans}, {tex}) // #{a:n} \n'
-        constraints = constraints.strip('\n')
+            locs = pa_many(self.positions[self.constrainatoms])
+            constraints = '\n'.join(
+                f'constrain({loc}, {radii[a]}, Black, {transmittances[a]}, '
+                f'{textures[a]}) // #{a:n} '
+                for a, loc in zip(self.constrainatoms, locs))
 
         pov = f"""#version 3.6;
 #include "colors.inc"
@@ -732,20 +798,17 @@ class POVRAYIsosurface:
     def wrapped_triples_section(triple_list,
                                 triple_format="<{:f}, {:f}, {:f}>".format,
                                 triples_per_line=4):
+        """Format triples as "<x, y, z>" wrapped over several lines."""
 
-        triples = [triple_format(*x) for x in triple_list]
-        n = len(triples)
-        s = ''
-        tpl = triples_per_line
-        c = 0
+        # Formatting plain Python numbers is much faster than numpy scalars:
+        triples = [triple_format(*x)
+                   for x in np.asarray(triple_list).reshape(-1, 3).tolist()]
 
-        while c < n - tpl:
-            c += tpl
-            s += '\n     '
-            s += ', '.join(triples[c - tpl:c])
-        s += '\n    '
-        s += ', '.join(triples[c:])
-        return s
+        tpl = triples_per_line
+        lines = [', '.join(triples[c:c + tpl])
+                 for c in range(0, len(triples), tpl)]
+        last = lines.pop() if lines else ''
+        return ''.join('\n     ' + line for line in lines) + '\n    ' + last
 
     @staticmethod
     def compute_mesh(density_grid, cut_off, spacing, gradient_direction):
@@ -758,14 +821,7 @@ class POVRAYIsosurface:
 
         """
 
-        # marching_cubes name was changed in skimage v0.19
-        try:
-            # New skimage
-            from skimage.measure import marching_cubes
-        except ImportError:
-            # Old skimage (remove at some point)
-            from skimage.measure import (
-                marching_cubes_lewiner as marching_cubes)
+        from skimage.measure import marching_cubes
 
         return marching_cubes(
             density_grid,
@@ -815,7 +871,7 @@ class POVRAYIsosurface:
 
         face_indices = self.wrapped_triples_section(
             triple_list=self.faces,
-            triple_format="<{:n}, {:n}, {:n}>".format,
+            triple_format="<{:d}, {:d}, {:d}>".format,
             triples_per_line=5)
 
         cell = self.cell
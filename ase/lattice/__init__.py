@@ -1,5 +1,6 @@
 from abc import abstractmethod, ABC
 import functools
+import math
 import warnings
 import numpy as np
 from typing import Dict, List
@@ -7,7 +8,7 @@ from typing import Dict, List
 from ase.cell import Cell
 from ase.build.bulk import bulk as newbulk
 from ase.dft.kpoints import parse_path_string, sc_special_points, BandPath
-from ase.utils import pbc2pbc
+from ase.utils import pbc2pbc, lazymethod
 
 
 @functools.wraps(newbulk)
@@ -60,6 +61,9 @@ class BravaisLattice(ABC):
             p[k] = float(v)
         assert set(p) == set(self.parameters)
         self._parameters = p
+        # Expose the parameters (self.a, self.alpha, ...) as plain
+        # attributes:
+        self.__dict__.update(p)
         self._eps = eps
 
         if len(self.variants) == 1:
@@ -78,11 +82,6 @@ class BravaisLattice(ABC):
         """
         return self._variant.name
 
-    def __getattr__(self, name: str):
-        if name in self._parameters:
-            return self._parameters[name]
-        return self.__getattribute__(name)  # Raises error
-
     def vars(self) -> Dict[str, float]:
         """Get parameter names and values of this lattice as a dictionary."""
         return dict(self._parameters)
@@ -94,16 +93,20 @@ class BravaisLattice(ABC):
 
     def tocell(self) -> Cell:
         """Return this lattice as a :class:`~ase.cell.Cell` object."""
-        cell = self._cell(**self._parameters)
-        return Cell(cell)
+        return Cell(self._get_cell().array.copy())
+
+    @lazymethod
+    def _get_cell(self) -> Cell:
+        # The parameters are fixed after __init__, so the cell is built
+        # only once.  Callers must not modify the returned object.
+        return Cell(self._cell(**self._parameters))
 
     def cellpar(self) -> np.ndarray:
         """Get cell lengths and angles as array of length 6.
 
         See :func:`ase.geometry.Cell.cellpar`."""
         # (Just a brute-force implementation)
-        cell = self.tocell()
-        return cell.cellpar()
+        return self._get_cell().cellpar()
 
     @property
     def special_path(self) -> str:
@@ -129,15 +132,13 @@ class BravaisLattice(ABC):
         """Return all special points for this lattice as an array.
 
         Ordering is consistent with special_point_names."""
+        return self._get_special_points_array().copy()
+
+    @lazymethod
+    def _get_special_points_array(self) -> np.ndarray:
         if self._variant.special_points is not None:
-            # Fixed dictionary of special points
-            d = self.get_special_points()
-            labels = self.special_point_names
-            assert len(d) == len(labels)
-            points = np.empty((len(d), 3))
-            for i, label in enumerate(labels):
-                points[i] = d[label]
-            return points
+            # Fixed special points, precomputed on the variant:
+            return self._variant.special_point_array
 
         # Special points depend on lattice parameters:
         points = self._special_points(variant=self._variant,
@@ -148,7 +149,8 @@ class BravaisLattice(ABC):
     def get_special_points(self) -> Dict[str, np.ndarray]:
         """Return a dictionary of named special k-points for this lattice."""
         if self._variant.special_points is not None:
-            return self._variant.special_points
+            return {label: point.copy() for label, point
+                    in self._variant.special_points.items()}
 
         labels = self.special_point_names
         points = self.get_special_points_array()
@@ -233,6 +235,7 @@ special_points={GNPSS1XYY1Z}, kpts=[51x3])
     def __repr__(self) -> str:
         return self.__format__('.20g')
 
+    @lazymethod
     def description(self) -> str:
         """Return complete description of lattice and Brillouin zone."""
         points = self.get_special_points()
@@ -284,13 +287,21 @@ Variant name: {name}
         self.name = name
         self.special_point_names = special_point_names
         self.special_path = special_path
+        special_point_array = None
         if special_points is not None:
-            special_points = dict(special_points)
-            for key, value in special_points.items():
-                special_points[key] = np.array(value)
+            # Store the points as a single read-only array ordered like
+            # special_point_names.  The dictionary keeps the caller's
+            # order (it shows up in bandpath output) and holds views of it.
+            labels = parse_path_string(special_point_names)[0]
+            assert len(special_points) == len(labels)
+            special_point_array = np.array([special_points[label]
+                                            for label in labels], float)
+            special_point_array.flags.writeable = False
+            index = {label: i for i, label in enumerate(labels)}
+            special_points = {label: special_point_array[index[label]]
+                              for label in special_points}
         self.special_points = special_points
-        # XXX Should make special_points available as a single array as well
-        # (easier to transform that way)
+        self.special_point_array = special_point_array
 
     def __str__(self) -> str:
         return self.variant_desc.format(**vars(self))
@@ -368,7 +379,8 @@ class FCC(Cubic):
     conventional_cellmap = _bcc_map
 
     def _cell(self, a):
-        return 0.5 * np.array([[0., a, a], [a, 0, a], [a, a, 0]])
+        h = 0.5 * a
+        return np.array([[0., h, h], [h, 0., h], [h, h, 0.]])
 
 
 @bravaisclass('body-centred cubic', 'cubic', 'cubic', 'cI', 'a',
@@ -377,7 +389,8 @@ class BCC(Cubic):
     conventional_cellmap = _fcc_map
 
     def _cell(self, a):
-        return 0.5 * np.array([[-a, a, a], [a, -a, a], [a, a, -a]])
+        h = 0.5 * a
+        return np.array([[-h, h, h], [h, -h, h], [h, h, -h]])
 
 
 @bravaisclass('primitive tetragonal', 'tetragonal', 'tetragonal', 'tP', 'ac',
@@ -391,7 +404,7 @@ class TET(BravaisLattice):
         super().__init__(a=a, c=c)
 
     def _cell(self, a, c):
-        return np.diag(np.array([a, a, c]))
+        return np.diag([a, a, c])
 
 
 # XXX in BCT2 we use S for Sigma.
@@ -408,7 +421,9 @@ class BCT(BravaisLattice):
         super().__init__(a=a, c=c)
 
     def _cell(self, a, c):
-        return 0.5 * np.array([[-a, a, c], [a, -a, c], [a, a, -c]])
+        ha = 0.5 * a
+        hc = 0.5 * c
+        return np.array([[-ha, ha, hc], [ha, -ha, hc], [ha, ha, -hc]])
 
     def _variant_name(self, a, c):
         return 'BCT1' if c < a else 'BCT2'
@@ -466,7 +481,7 @@ class ORC(Orthorhombic):
     conventional_cellmap = _identity
 
     def _cell(self, a, b, c):
-        return np.diag([a, b, c]).astype(float)
+        return np.diag([a, b, c])
 
 
 @bravaisclass('face-centred orthorhombic', 'orthorhombic', 'orthorhombic',
@@ -479,7 +494,10 @@ class ORCF(Orthorhombic):
     conventional_cellmap = _bcc_map
 
     def _cell(self, a, b, c):
-        return 0.5 * np.array([[0, b, c], [a, 0, c], [a, b, 0]])
+        ha = 0.5 * a
+        hb = 0.5 * b
+        hc = 0.5 * c
+        return np.array([[0., hb, hc], [ha, 0., hc], [ha, hb, 0.]])
 
     def _special_points(self, a, b, c, variant):
         a2 = a * a
@@ -536,7 +554,10 @@ class ORCI(Orthorhombic):
     conventional_cellmap = _fcc_map
 
     def _cell(self, a, b, c):
-        return 0.5 * np.array([[-a, b, c], [a, -b, c], [a, b, -c]])
+        ha = 0.5 * a
+        hb = 0.5 * b
+        hc = 0.5 * c
+        return np.array([[-ha, hb, hc], [ha, -hb, hc], [ha, hb, -hc]])
 
     def _special_points(self, a, b, c, variant):
         a2 = a**2
@@ -608,7 +629,7 @@ class HEX(BravaisLattice):
         super().__init__(a=a, c=c)
 
     def _cell(self, a, c):
-        x = 0.5 * np.sqrt(3)
+        x = 0.5 * math.sqrt(3)
         return np.array([[0.5 * a, -x * a, 0], [0.5 * a, x * a, 0],
                          [0., 0., c]])
 
@@ -628,10 +649,10 @@ class RHL(BravaisLattice):
         super().__init__(a=a, alpha=alpha)
 
     def _cell(self, a, alpha):
-        alpha *= np.pi / 180
-        acosa = a * np.cos(alpha)
-        acosa2 = a * np.cos(0.5 * alpha)
-        asina2 = a * np.sin(0.5 * alpha)
+        alpha *= _degrees
+        acosa = a * math.cos(alpha)
+        acosa2 = a * math.cos(0.5 * alpha)
+        asina2 = a * math.sin(0.5 * alpha)
         acosfrac = acosa / acosa2
         xx = (1 - acosfrac**2)
         assert xx > 0.0
@@ -642,8 +663,9 @@ class RHL(BravaisLattice):
         return 'RHL1' if alpha < 90 else 'RHL2'
 
     def _special_points(self, a, alpha, variant):
+        alpha *= _degrees
         if variant.name == 'RHL1':
-            cosa = np.cos(alpha * _degrees)
+            cosa = math.cos(alpha)
             eta = (1 + 4 * cosa) / (2 + 4 * cosa)
             nu = .75 - 0.5 * eta
             points = [[0, 0, 0],
@@ -659,7 +681,7 @@ class RHL(BravaisLattice):
                       [nu, 0, -nu],
                       [.5, .5, .5]]
         else:
-            eta = 1 / (2 * np.tan(alpha * _degrees / 2)**2)
+            eta = 1 / (2 * math.tan(0.5 * alpha)**2)
             nu = .75 - 0.5 * eta
             points = [[0, 0, 0],
                       [.5, -.5, 0],
@@ -693,11 +715,13 @@ class MCL(BravaisLattice):
     def _cell(self, a, b, c, alpha):
         alpha *= _degrees
         return np.array([[a, 0, 0], [0, b, 0],
-                         [0, c * np.cos(alpha), c * np.sin(alpha)]])
+                         [0, c * math.cos(alpha), c * math.sin(alpha)]])
 
     def _special_points(self, a, b, c, alpha, variant):
-        cosa = np.cos(alpha * _degrees)
-        eta = (1 - b * cosa / c) / (2 * np.sin(alpha * _degrees)**2)
+        alpha *= _degrees
+        cosa = math.cos(alpha)
+        sina = math.sin(alpha)
+        eta = (1 - b * cosa / c) / (2 * sina**2)
         nu = .5 - eta * c * cosa / b
 
         points = [[0, 0, 0],
@@ -723,6 +747,106 @@ class MCL(BravaisLattice):
         return 'MCL'
 
 
+# Special points of the MCLC variants as functions of the lattice
+# parameters, cos(alpha) and sin(alpha)**2:
+def _mclc12_special_points(a, b, c, cosa, sina2):
+    a2 = a * a
+    b2 = b * b
+    zeta = (2 - b * cosa / c) / (4 * sina2)
+    eta = 0.5 + 2 * zeta * c * cosa / b
+    psi = .75 - a2 / (4 * b2 * sina2)
+    phi = psi + (.75 - psi) * b * cosa / c
+
+    points = [[0, 0, 0],
+              [.5, 0, 0],
+              [0, -.5, 0],
+              [1 - zeta, 1 - zeta, 1 - eta],
+              [zeta, zeta, eta],
+              [-zeta, -zeta, 1 - eta],
+              [1 - zeta, -zeta, 1 - eta],
+              [phi, 1 - phi, .5],
+              [1 - phi, phi - 1, .5],
+              [.5, .5, .5],
+              [.5, 0, .5],
+              [1 - psi, psi - 1, 0],
+              [psi, 1 - psi, 0],
+              [psi - 1, -psi, 0],
+              [.5, .5, 0],
+              [-.5, -.5, 0],
+              [0, 0, .5]]
+    return points
+
+
+def _mclc34_special_points(a, b, c, cosa, sina2):
+    a2 = a * a
+    b2 = b * b
+    mu = .25 * (1 + b2 / a2)
+    delta = b * c * cosa / (2 * a2)
+    zeta = mu - 0.25 + (1 - b * cosa / c) / (4 * sina2)
+    eta = 0.5 + 2 * zeta * c * cosa / b
+    phi = 1 + zeta - 2 * mu
+    psi = eta - 2 * delta
+
+    points = [[0, 0, 0],
+              [1 - phi, 1 - phi, 1 - psi],
+              [phi, phi - 1, psi],
+              [1 - phi, -phi, 1 - psi],
+              [zeta, zeta, eta],
+              [1 - zeta, -zeta, 1 - eta],
+              [-zeta, -zeta, 1 - eta],
+              [.5, -.5, .5],
+              [.5, 0, .5],
+              [.5, 0, 0],
+              [0, -.5, 0],
+              [.5, -.5, 0],
+              [mu, mu, delta],
+              [1 - mu, -mu, -delta],
+              [-mu, -mu, -delta],
+              [mu, mu - 1, delta],
+              [0, 0, .5]]
+    return points
+
+
+def _mclc5_special_points(a, b, c, cosa, sina2):
+    a2 = a * a
+    b2 = b * b
+    zeta = .25 * (b2 / a2 + (1 - b * cosa / c) / sina2)
+    eta = 0.5 + 2 * zeta * c * cosa / b
+    mu = .5 * eta + b2 / (4 * a2) - b * c * cosa / (2 * a2)
+    nu = 2 * mu - zeta
+    omega = (4 * nu - 1 - b2 * sina2 / a2) * c / (2 * b * cosa)
+    delta = zeta * c * cosa / b + omega / 2 - .25
+    rho = 1 - zeta * a2 / b2
+
+    points = [[0, 0, 0],
+              [nu, nu, omega],
+              [1 - nu, 1 - nu, 1 - omega],
+              [nu, nu - 1, omega],
+              [zeta, zeta, eta],
+              [1 - zeta, -zeta, 1 - eta],
+              [-zeta, -zeta, 1 - eta],
+              [rho, 1 - rho, .5],
+              [1 - rho, rho - 1, .5],
+              [.5, .5, .5],
+              [.5, 0, .5],
+              [.5, 0, 0],
+              [0, -.5, 0],
+              [.5, -.5, 0],
+              [mu, mu, delta],
+              [1 - mu, -mu, -delta],
+              [-mu, -mu, -delta],
+              [mu, mu - 1, delta],
+              [0, 0, .5]]
+    return points
+
+
+_mclc_special_points = {'MCLC1': _mclc12_special_points,
+                        'MCLC2': _mclc12_special_points,
+                        'MCLC3': _mclc34_special_points,
+                        'MCLC4': _mclc34_special_points,
+                        'MCLC5': _mclc5_special_points}
+
+
 @bravaisclass('base-centred monoclinic', 'monoclinic', 'monoclinic', 'mC',
               ('a', 'b', 'c', 'alpha'),
               [['MCLC1', 'GNN1FF1F2F3II1LMXX1X2YY1Z',
@@ -744,28 +868,28 @@ class MCLC(BravaisLattice):
         super().__init__(a=a, b=b, c=c, alpha=alpha)
 
     def _cell(self, a, b, c, alpha):
-        alpha *= np.pi / 180
+        alpha *= _degrees
         return np.array([[0.5 * a, 0.5 * b, 0], [-0.5 * a, 0.5 * b, 0],
-                         [0, c * np.cos(alpha), c * np.sin(alpha)]])
+                         [0, c * math.cos(alpha), c * math.sin(alpha)]])
 
     def _variant_name(self, a, b, c, alpha):
         # from ase.geometry.cell import mclc
         # okay, this is a bit hacky
 
         # We need the same parameters here as when determining the points.
-        # Right now we just repeat the code:
-        check_mcl(a, b, c, alpha)
-
+        # Right now we just repeat the code.
+        # (The parameters were already validated by check_mcl in __init__.)
         a2 = a * a
         b2 = b * b
-        cosa = np.cos(alpha * _degrees)
-        sina = np.sin(alpha * _degrees)
+        alpha *= _degrees
+        cosa = math.cos(alpha)
+        sina = math.sin(alpha)
         sina2 = sina**2
 
-        cell = self.tocell()
-        lengths_angles = Cell(cell.reciprocal()).cellpar()
-
-        kgamma = lengths_angles[-1]
+        # Angle between the first two reciprocal lattice vectors, which
+        # for the MCLC cell reduces to a closed form:
+        b2sina2 = b2 * sina2
+        kgamma = math.acos((a2 - b2sina2) / (a2 + b2sina2)) / _degrees
 
         eps = self._eps
         # We should not compare angles in degrees versus lengths with
@@ -775,7 +899,7 @@ class MCLC(BravaisLattice):
         elif kgamma > 90:
             variant = 1
         elif kgamma < 90:
-            num = b * cosa / c + b2 * sina2 / a2
+            num = b * cosa / c + b2sina2 / a2
             if abs(num - 1) < eps:
                 variant = 4
             elif num < 1:
@@ -786,93 +910,11 @@ class MCLC(BravaisLattice):
         return variant
 
     def _special_points(self, a, b, c, alpha, variant):
-        variant = int(variant.name[-1])
-
-        a2 = a * a
-        b2 = b * b
-        # c2 = c * c
-        cosa = np.cos(alpha * _degrees)
-        sina = np.sin(alpha * _degrees)
-        sina2 = sina**2
-
-        if variant == 1 or variant == 2:
-            zeta = (2 - b * cosa / c) / (4 * sina2)
-            eta = 0.5 + 2 * zeta * c * cosa / b
-            psi = .75 - a2 / (4 * b2 * sina * sina)
-            phi = psi + (.75 - psi) * b * cosa / c
-
-            points = [[0, 0, 0],
-                      [.5, 0, 0],
-                      [0, -.5, 0],
-                      [1 - zeta, 1 - zeta, 1 - eta],
-                      [zeta, zeta, eta],
-                      [-zeta, -zeta, 1 - eta],
-                      [1 - zeta, -zeta, 1 - eta],
-                      [phi, 1 - phi, .5],
-                      [1 - phi, phi - 1, .5],
-                      [.5, .5, .5],
-                      [.5, 0, .5],
-                      [1 - psi, psi - 1, 0],
-                      [psi, 1 - psi, 0],
-                      [psi - 1, -psi, 0],
-                      [.5, .5, 0],
-                      [-.5, -.5, 0],
-                      [0, 0, .5]]
-        elif variant == 3 or variant == 4:
-            mu = .25 * (1 + b2 / a2)
-            delta = b * c * cosa / (2 * a2)
-            zeta = mu - 0.25 + (1 - b * cosa / c) / (4 * sina2)
-            eta = 0.5 + 2 * zeta * c * cosa / b
-            phi = 1 + zeta - 2 * mu
-            psi = eta - 2 * delta
-
-            points = [[0, 0, 0],
-                      [1 - phi, 1 - phi, 1 - psi],
-                      [phi, phi - 1, psi],
-                      [1 - phi, -phi, 1 - psi],
-                      [zeta, zeta, eta],
-                      [1 - zeta, -zeta, 1 - eta],
-                      [-zeta, -zeta, 1 - eta],
-                      [.5, -.5, .5],
-                      [.5, 0, .5],
-                      [.5, 0, 0],
-                      [0, -.5, 0],
-                      [.5, -.5, 0],
-                      [mu, mu, delta],
-                      [1 - mu, -mu, -delta],
-                      [-mu, -mu, -delta],
-                      [mu, mu - 1, delta],
-                      [0, 0, .5]]
-        elif variant == 5:
-            zeta = .25 * (b2 / a2 + (1 - b * cosa / c) / sina2)
-            eta = 0.5 + 2 * zeta * c * cosa / b
-            mu = .5 * eta + b2 / (4 * a2) - b * c * cosa / (2 * a2)
-            nu = 2 * mu - zeta
-            omega = (4 * nu - 1 - b2 * sina2 / a2) * c / (2 * b * cosa)
-            delta = zeta * c * cosa / b + omega / 2 - .25
-            rho = 1 - zeta * a2 / b2
-
-            points = [[0, 0, 0],
-                      [nu, nu, omega],
-                      [1 - nu, 1 - nu, 1 - omega],
-                      [nu, nu - 1, omega],
-                      [zeta, zeta, eta],
-                      [1 - zeta, -zeta, 1 - eta],
-                      [-zeta, -zeta, 1 - eta],
-                      [rho, 1 - rho, .5],
-                      [1 - rho, rho - 1, .5],
-                      [.5, .5, .5],
-                      [.5, 0, .5],
-                      [.5, 0, 0],
-                      [0, -.5, 0],
-                      [.5, -.5, 0],
-                      [mu, mu, delta],
-                      [1 - mu, -mu, -delta],
-                      [-mu, -mu, -delta],
-                      [mu, mu - 1, delta],
-                      [0, 0, .5]]
-
-        return points
+        alpha *= _degrees
+        cosa = math.cos(alpha)
+        sina2 = math.sin(alpha)**2
+        special_points = _mclc_special_points[variant.name]
+        return special_points(a, b, c, cosa, sina2)
 
 
 tri_angles_explanation = """\
@@ -885,6 +927,27 @@ If you don't care, please use Cell.fromcellpar() instead."""
 
 # XXX labels, paths, are all the same.
 
+# The TRI special points do not depend on the lattice parameters:
+_tri_a_special_points = np.array([[0., 0., 0.],
+                                  [.5, .5, 0],
+                                  [0, .5, .5],
+                                  [.5, 0, .5],
+                                  [.5, .5, .5],
+                                  [.5, 0, 0],
+                                  [0, .5, 0],
+                                  [0, 0, .5]])
+_tri_a_special_points.flags.writeable = False
+
+_tri_b_special_points = np.array([[0, 0, 0],
+                                  [.5, -.5, 0],
+                                  [0, 0, .5],
+                                  [-.5, -.5, .5],
+                                  [0, -.5, .5],
+                                  [0, -0.5, 0],
+                                  [.5, 0, 0],
+                                  [-.5, 0, .5]], float)
+_tri_b_special_points.flags.writeable = False
+
 
 @bravaisclass('primitive triclinic', 'triclinic', 'triclinic', 'aP',
               ('a', 'b', 'c', 'alpha', 'beta', 'gamma'),
@@ -901,11 +964,13 @@ class TRI(BravaisLattice):
                          gamma=gamma)
 
     def _cell(self, a, b, c, alpha, beta, gamma):
-        alpha, beta, gamma = np.array([alpha, beta, gamma])
-        singamma = np.sin(gamma * _degrees)
-        cosgamma = np.cos(gamma * _degrees)
-        cosbeta = np.cos(beta * _degrees)
-        cosalpha = np.cos(alpha * _degrees)
+        alpha *= _degrees
+        beta *= _degrees
+        gamma *= _degrees
+        singamma = math.sin(gamma)
+        cosgamma = math.cos(gamma)
+        cosbeta = math.cos(beta)
+        cosalpha = math.cos(alpha)
         a3x = c * cosbeta
         a3y = c / singamma * (cosalpha - cosbeta * cosgamma)
         a3z = c / singamma * np.sqrt(singamma**2 - cosalpha**2 - cosbeta**2
@@ -948,25 +1013,8 @@ class TRI(BravaisLattice):
         # (None of the points actually depend on any parameters)
         # (We should store the points openly on the variant objects)
         if variant.name == 'TRI1a' or variant.name == 'TRI2a':
-            points = [[0., 0., 0.],
-                      [.5, .5, 0],
-                      [0, .5, .5],
-                      [.5, 0, .5],
-                      [.5, .5, .5],
-                      [.5, 0, 0],
-                      [0, .5, 0],
-                      [0, 0, .5]]
-        else:
-            points = [[0, 0, 0],
-                      [.5, -.5, 0],
-                      [0, 0, .5],
-                      [-.5, -.5, .5],
-                      [0, -.5, .5],
-                      [0, -0.5, 0],
-                      [.5, 0, 0],
-                      [-.5, 0, .5]]
-
-        return points
+            return _tri_a_special_points
+        return _tri_b_special_points
 
 
 def get_subset_points(names, points):
@@ -989,16 +1037,18 @@ class OBL(BravaisLattice):
         super().__init__(a=a, b=b, alpha=alpha, **kwargs)
 
     def _cell(self, a, b, alpha):
-        cosa = np.cos(alpha * _degrees)
-        sina = np.sin(alpha * _degrees)
+        alpha *= _degrees
+        cosa = math.cos(alpha)
+        sina = math.sin(alpha)
 
         return np.array([[a, 0, 0],
                          [b * cosa, b * sina, 0],
                          [0., 0., 0.]])
 
     def _special_points(self, a, b, alpha, variant):
-        cosa = np.cos(alpha * _degrees)
-        eta = (1 - a * cosa / b) / (2 * np.sin(alpha * _degrees)**2)
+        alpha *= _degrees
+        cosa = math.cos(alpha)
+        eta = (1 - a * cosa / b) / (2 * math.sin(alpha)**2)
         nu = .5 - eta * b * cosa / a
 
         points = [[0, 0, 0],
@@ -1021,7 +1071,7 @@ class HEX2D(BravaisLattice):
         super().__init__(a=a, **kwargs)
 
     def _cell(self, a):
-        x = 0.5 * np.sqrt(3)
+        x = 0.5 * math.sqrt(3)
         return np.array([[a, 0, 0],
                          [-0.5 * a, x * a, 0],
                          [0., 0., 0.]])
@@ -1064,17 +1114,19 @@ class CRECT(BravaisLattice):
         super().__init__(a=a, alpha=alpha, **kwargs)
 
     def _cell(self, a, alpha):
-        x = np.cos(alpha * _degrees)
-        y = np.sin(alpha * _degrees)
+        alpha *= _degrees
+        x = math.cos(alpha)
+        y = math.sin(alpha)
         return np.array([[a, 0, 0],
                          [a * x, a * y, 0],
                          [0, 0, 0.]])
 
     def _special_points(self, a, alpha, variant):
-        sina2 = np.sin(alpha / 2 * _degrees)**2
-        sina = np.sin(alpha * _degrees)**2
+        alpha *= _degrees
+        sina2 = math.sin(0.5 * alpha)**2
+        sina = math.sin(alpha)**2
         eta = sina2 / sina
-        cosa = np.cos(alpha * _degrees)
+        cosa = math.cos(alpha)
         xi = eta * cosa
 
         points = [[0, 0, 0],
@@ -1115,16 +1167,21 @@ class LINE(BravaisLattice):
 def celldiff(cell1, cell2):
     """Return a unitless measure of the difference between two cells."""
     cell1 = Cell.ascell(cell1).complete()
+    return _celldiff(cell1.volume, cell1 @ cell1.T, cell2)
+
+
+def _celldiff(volume1, metric1, cell2):
+    # Like celldiff(), but with volume and metric (cell @ cell.T) of the
+    # completed first cell given, so they can be reused across calls.
     cell2 = Cell.ascell(cell2).complete()
-    v1v2 = cell1.volume * cell2.volume
+    v1v2 = volume1 * cell2.volume
     if v1v2 < 1e-10:
         # (Proposed cell may be linearly dependent)
         return np.inf
 
     scale = v1v2**(-1. / 3.)  # --> 1/Ang^2
-    x1 = cell1 @ cell1.T
     x2 = cell2 @ cell2.T
-    dev = scale * np.abs(x2 - x1).max()
+    dev = scale * np.abs(x2 - metric1).max()
     return dev
 
 
@@ -1145,9 +1202,23 @@ def identify_lattice(cell, eps=2e-4, *, pbc=True):
     Returns Bravais lattice object representing the cell along with
     an operation that, applied to the cell, yields the same lengths
     and angles as the Bravais lattice object."""
+    cell = Cell.ascell(cell)
+    pbc = cell.any(1) & pbc2pbc(pbc)
+    # Results are cached since the same cell is often identified
+    # repeatedly (bandpaths, GUI, ...).  Only the lattice name and
+    # parameters are cached so every caller gets its own lattice object:
+    name, parameters, op = _identify_lattice(cell.array.tobytes(), eps,
+                                             tuple(bool(p) for p in pbc))
+    lat = bravais_lattices[name](**dict(parameters))
+    return lat, op.copy()
+
+
+@functools.lru_cache(maxsize=128)
+def _identify_lattice(cellbytes, eps, pbc):
     from ase.geometry.bravais_type_engine import niggli_op_table
 
-    pbc = cell.any(1) & pbc2pbc(pbc)
+    cell = Cell(np.frombuffer(cellbytes).reshape(3, 3).copy())
+    pbc = np.array(pbc)
     npbc = sum(pbc)
 
     cell = cell.uncomplete(pbc)
@@ -1187,7 +1258,7 @@ def identify_lattice(cell, eps=2e-4, *, pbc=True):
         best = None
         best_defect = np.inf
         for lat, op in matching_lattices:
-            cell = lat.tocell()
+            cell = lat._get_cell()
             lengths = cell.lengths()[pbc]
             generalized_volume = cell.complete().volume
             defect = np.prod(lengths) / generalized_volume
@@ -1208,11 +1279,18 @@ def identify_lattice(cell, eps=2e-4, *, pbc=True):
                     op = repair_op @ op
                     best = lat, op
 
-            return best
+            lat, op = best
+            return lat.name, tuple(lat.vars().items()), op
 
     raise RuntimeError('Failed to recognize lattice')
 
 
+# Ratios of the FCC and BCC lattice constants to their primitive
+# cell vector lengths:
+_fcc_length_factor = math.sqrt(2)
+_bcc_length_factor = 2.0 / math.sqrt(3)
+
+
 class LatticeChecker:
     # The check order is slightly different than elsewhere listed order
     # as we need to check HEX/RHL before the ORCx family.
@@ -1248,6 +1326,12 @@ class LatticeChecker:
         #   [a1 · a1, a2 · a2, a3 · a3, a2 · a3, a3 · a1, a1 · a2]
         self.prods = (cell @ cell.T).flat[[0, 4, 8, 5, 2, 1]]
 
+        # Volume and metric of the completed cell are needed to compare
+        # against every candidate lattice, so compute them only once:
+        complete = cell.complete()
+        self._volume = complete.volume
+        self._metric = complete @ complete.T
+
     def _check(self, latcls, *args):
         if any(arg <= 0 for arg in args):
             return None
@@ -1256,8 +1340,7 @@ class LatticeChecker:
         except UnconventionalLattice:
             return None
 
-        newcell = lat.tocell()
-        err = celldiff(self.cell, newcell)
+        err = _celldiff(self._volume, self._metric, lat._get_cell())
         if err < self.eps:
             return lat
 
@@ -1306,10 +1389,10 @@ class LatticeChecker:
         return self._check(CUB, self.A0)
 
     def FCC(self):
-        return self._check(FCC, np.sqrt(2) * self.A0)
+        return self._check(FCC, _fcc_length_factor * self.A0)
 
     def BCC(self):
-        return self._check(BCC, 2.0 * self.A0 / np.sqrt(3))
+        return self._check(BCC, _bcc_length_factor * self.A0)
 
     def TET(self):
         return self._check(TET, self.A, self.C)
@@ -1389,7 +1472,7 @@ class LatticeChecker:
         mclc_a, mclc_b = orcc_ab[::-1]  # a, b reversed wrt. ORCC
         mclc_cosa = 2.0 * prods[3] / (mclc_b * C)
         if -1 < mclc_cosa < 1:
-            mclc_alpha = np.arccos(mclc_cosa) * 180 / np.pi
+            mclc_alpha = math.acos(mclc_cosa) / _degrees
             if mclc_b > C:
                 # XXX Temporary fix for certain otherwise
                 # unrecognizable lattices.
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Sequence, Union
 
 import numpy as np
@@ -32,10 +33,9 @@ class Properties(Mapping):
         if not self.shape_is_consistent(prop, value):
             raise ValueError(f'{name} has bad shape: {shape}')
 
-        for i, spec in enumerate(prop.shapespec):
-            if not isinstance(spec, str) or spec in self._dct:
-                continue
-            self._setvalue(spec, shape[i])
+        for i, spec in prop.named_dims:
+            if spec not in self._dct:
+                self._setvalue(spec, shape[i])
 
         self._dct[name] = value
 
@@ -45,14 +45,14 @@ class Properties(Mapping):
         For example, forces of shape (7, 3) are consistent
         unless properties already have "natoms" with non-7 value.
         """
-        shapespec = prop.shapespec
         shape = np.shape(value)
-        if len(shapespec) != len(shape):
+        if len(prop.shapespec) != len(shape):
             return False
-        for dimspec, dim in zip(shapespec, shape):
-            if isinstance(dimspec, str):
-                dimspec = self._dct.get(dimspec, dim)
-            if dimspec != dim:
+        for i, dimspec in prop.fixed_dims:
+            if dimspec != shape[i]:
+                return False
+        for i, dimspec in prop.named_dims:
+            if self._dct.get(dimspec, shape[i]) != shape[i]:
                 return False
         return True
 
@@ -61,7 +61,9 @@ class Properties(Mapping):
         return f'({clsname}({self._dct})'
 
 
-all_outputs = {}
+_all_outputs = {}
+# Read-only view of the registry; properties are added with _defineprop()
+all_outputs = MappingProxyType(_all_outputs)
 
 
 class Property(ABC):
@@ -71,6 +73,13 @@ class Property(ABC):
         self.dtype = dtype
         self.shapespec = shapespec
 
+        # (index, spec) of the dimensions given by other properties
+        # such as 'natoms', and of those with a fixed length:
+        self.named_dims = tuple((i, spec) for i, spec in enumerate(shapespec)
+                                if isinstance(spec, str))
+        self.fixed_dims = tuple((i, spec) for i, spec in enumerate(shapespec)
+                                if not isinstance(spec, str))
+
     @abstractmethod
     def normalize_type(self, value):
         ...
@@ -86,16 +95,20 @@ class ScalarProperty(Property):
         super().__init__(name, dtype, tuple())
 
     def normalize_type(self, value):
-        if not np.isscalar(value):
-            raise TypeError('Expected scalar')
+        # float() and int() accept numbers, numpy scalars and strings and
+        # raise TypeError for other objects, but would also unpack
+        # single-element arrays:
+        if isinstance(value, np.ndarray):
+            raise TypeError('Expected scalar, got array')
         return self.dtype(value)
 
 
 class ArrayProperty(Property):
     def normalize_type(self, value):
-        if np.isscalar(value):
+        array = np.asarray(value, dtype=self.dtype)
+        if array.ndim == 0:
             raise TypeError('Expected array, got scalar')
-        return np.asarray(value, dtype=self.dtype)
+        return array
 
 
 ShapeSpec = Union[str, int]
@@ -118,8 +131,8 @@ def _defineprop(
     else:
         prop = ArrayProperty(name, dtype, shape)
 
-    assert name not in all_outputs, name
-    all_outputs[name] = prop
+    assert name not in _all_outputs, name
+    _all_outputs[name] = prop
     return prop
 
 
@@ -39,3 +39,13 @@ def test_variants(lat):
     dct = lat.get_special_points()
     assert len(dct) == len(lat.special_point_names)
     print(lat)
+
+
+@pytest.mark.parametrize('lat', list(all_variants()),
+                         ids=lambda lat: lat.variant)
+def test_special_points_not_shared(lat):
+    points = lat.get_special_points()
+    for point in points.values():
+        point += 1.0
+    for label, point in lat.get_special_points().items():
+        assert not np.allclose(point, points[label])
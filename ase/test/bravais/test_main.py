@@ -115,3 +115,12 @@ def test_1d():
     check('line', Cell(np.diag([a, 1, 1.0])), pbc=np.array([1, 0, 0]))
     check('line', Cell(np.diag([0.0, 0, a])))
     check('line', Cell(np.diag([1.0, 1, a])), pbc=np.array([0, 0, 1]))
+
+
+def test_identify_returns_fresh_lattice():
+    cell = Cell.fromcellpar([3, 4, 5, 80, 70, 60])
+    lat1 = cell.get_bravais_lattice()
+    lat2 = cell.get_bravais_lattice()
+    assert lat1 is not lat2
+    lat1.a = -1.0
+    assert cell.get_bravais_lattice().a == lat2.a
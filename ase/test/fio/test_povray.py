@@ -5,10 +5,11 @@ import pytest
 
 from ase import Atoms
 from ase.cell import Cell
-from ase.build import molecule
+from ase.build import bulk, molecule
 from ase.io.pov import (write_pov, get_bondpairs, set_high_bondorder_pairs,
-                        POVRAYIsosurface)
+                        POVRAY, POVRAYIsosurface)
 from ase.io import write
+from ase.io.utils import PlottingVariables
 
 
 def test_povray_io(testdir, povray_executable):
@@ -44,6 +45,32 @@ def test_povray_highorder(testdir, povray_executable):
     print(pngfile.absolute())
 
 
+def test_bondpairs_nonperiodic():
+    atoms = molecule('C60')
+    pairs = get_bondpairs(atoms)
+    assert len(pairs) == 90
+
+    # Same bonds when found with the periodic neighbor list
+    atoms.center(vacuum=5.0)
+    atoms.pbc = True
+    ref = get_bondpairs(atoms)
+    assert sorted((a, b) for a, b, _ in pairs) == sorted(
+        (a, b) for a, b, _ in ref)
+    assert not any(np.any(offset) for _, _, offset in pairs)
+
+
+@pytest.mark.parametrize('bondatoms', [
+    [(0,)],
+    [(0, 1, (0, 0))],
+    [(0, 1, (0, 0, 0), 4)],
+    [(0, 1, (0, 0, 0), 2, (0.1, 0.1))],
+])
+def test_bad_bondatoms(testdir, bondatoms):
+    with pytest.raises((ValueError, RuntimeError), match='Error at'):
+        write_pov('tmp.pov', molecule('H2'),
+                  povray_settings=dict(bondatoms=bondatoms))
+
+
 def test_deprecated(testdir):
     with pytest.warns(FutureWarning):
         write_pov('tmp.pov', molecule('H2'), run_povray=True)
@@ -92,3 +119,46 @@ def test_render_isosurface(testdir, isosurface_things, povray_executable):
     png_path = renderer.render(povray_executable=povray_executable)
     # does the diamond appear over the second hydrogen atom?
     assert png_path.is_file()
+
+
+def test_high_order_bond_to_own_image(testdir):
+    # posa == posb for a bond to the atom's own periodic image
+    write_pov('tmp.pov', bulk('Cu'),
+              povray_settings=dict(bondatoms=[(0, 0, (1, 0, 0), 2)]))
+    with open('tmp.pov') as fd:
+        bonds = [line for line in fd if 'Rbond texture' in line]
+    assert len(bonds) == 4
+    starts = np.array([[float(x) for x in
+                        line.split('<')[1].split('>')[0].split(',')]
+                       for line in bonds])
+    # The two lines of the double bond are shifted by the default
+    # bond_offset (bondlinewidth, bondlinewidth, 0), left unrotated:
+    assert starts[2] - starts[0] == pytest.approx([0.1, 0.1, 0], abs=0.015)
+    assert starts[3] - starts[1] == pytest.approx([0.1, 0.1, 0], abs=0.015)
+
+
+def test_added_material_style_is_declared(testdir, monkeypatch):
+    monkeypatch.setitem(POVRAY.material_styles_dict, 'mystyle',
+                        'finish {ambient 0.1}')
+    write_pov('tmp.pov', molecule('H2O'),
+              povray_settings=dict(textures=['mystyle'] * 3))
+    with open('tmp.pov') as fd:
+        assert '#declare mystyle = finish {ambient 0.1}' in fd.read()
+
+
+def test_bondatoms_changed_in_place(testdir):
+    pvars = PlottingVariables(molecule('H2O'), scale=1.0)
+    pov = POVRAY.from_PlottingVariables(pvars, bondatoms=[(0, 1)])
+    pov.bondatoms.append((0, 2))
+    pov.write_pov('tmp.pov')
+    with open('tmp.pov') as fd:
+        assert fd.read().count('Rbond texture') == 4
+
+
+def test_colors_changed_in_place(testdir):
+    pvars = PlottingVariables(molecule('H2O'), scale=1.0)
+    pov = POVRAY.from_PlottingVariables(pvars)
+    pov.colors[0] = (1., 0., 0.)
+    pov.write_pov('tmp.pov')
+    with open('tmp.pov') as fd:
+        assert 'rgb <1.00, 0.00, 0.00>' in fd.read()
@@ -5,7 +5,12 @@ from ase.outputs import Properties, all_outputs
 
 @pytest.mark.parametrize('name', list(all_outputs))
 def test_print_props(name):
-    print(all_outputs[name])
+    assert repr(all_outputs[name]).startswith(f'Property({name!r}, dtype=')
+
+
+def test_outputs_readonly():
+    with pytest.raises(TypeError):
+        all_outputs['energy'] = all_outputs['free_energy']
 
 
 natoms = 7